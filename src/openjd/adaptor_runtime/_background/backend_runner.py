@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import dataclasses
 import json
 import logging
 import os
@@ -25,10 +26,12 @@ if OSName.is_windows():
     from .backend_named_pipe_server import WinBackgroundNamedPipeServer
 from .log_buffers import LogBuffer
 from .model import ConnectionSettings
-from .model import DataclassJSONEncoder
 
 _logger = logging.getLogger(__name__)
 
+# Byte written to the ready pipe once the connection file has been written
+_READY_SIGNAL = b"\x01"
+
 
 class BackendRunner:
     """
@@ -41,9 +44,20 @@ class BackendRunner:
         *,
         connection_file_path: Path,
         log_buffer: LogBuffer | None = None,
+        ready_fd: int | None = None,
     ) -> None:
+        """
+        Args:
+            adaptor_runner (AdaptorRunner): The adaptor runner to serve requests for.
+            connection_file_path (Path): The path to write the connection file to.
+            log_buffer (LogBuffer, optional): The buffer that adaptor output is written to.
+            ready_fd (int, optional): File descriptor of the write end of a pipe inherited from
+                the frontend. A single byte is written to it, and then it is closed, once the
+                connection file has been written. Defaults to None.
+        """
         self._adaptor_runner = adaptor_runner
         self._connection_file_path = connection_file_path
+        self._ready_fd = ready_fd
 
         self._log_buffer = log_buffer
         self._server: Optional[Union[BackgroundHTTPServer, WinBackgroundNamedPipeServer]] = None
@@ -119,11 +133,7 @@ class BackendRunner:
             with secure_open(
                 self._connection_file_path, open_mode="w", encoding="utf-8"
             ) as conn_file:
-                json.dump(
-                    ConnectionSettings(server_path),
-                    conn_file,
-                    cls=DataclassJSONEncoder,
-                )
+                json.dump(dataclasses.asdict(ConnectionSettings(server_path)), conn_file)
         except OSError as e:
             _logger.error(f"Error writing to connection file: {e}")
             _logger.info("Shutting down server...")
@@ -139,6 +149,14 @@ class BackendRunner:
                 callbacks = list(on_connection_file_written)
                 for cb in callbacks:
                     cb()
+            if self._ready_fd is not None:  # pragma: is-windows
+                # Signal the frontend that the connection file is ready to be read
+                try:
+                    os.write(self._ready_fd, _READY_SIGNAL)
+                except OSError as e:  # pragma: no cover
+                    _logger.warning(f"Failed to signal the frontend that the backend is ready: {e}")
+                finally:
+                    os.close(self._ready_fd)
         finally:
             # Block until the shutdown_event is set
             shutdown_event.wait()
@@ -6,6 +6,7 @@ import http.client as http_client
 import json
 import logging
 import os
+import select
 import signal
 import socket
 import subprocess
@@ -35,6 +36,7 @@ from .model import (
 )
 
 _FRONTEND_RUNNER_REQUEST_TIMEOUT: float = 5.0
+_BACKEND_READY_TIMEOUT_S: float = 10.0
 
 if OSName.is_windows():
     from ...adaptor_runtime_client.named_pipe.named_pipe_helper import NamedPipeHelper
@@ -75,6 +77,7 @@ class FrontendRunner:
         self._timeout_s = timeout_s
         self._heartbeat_interval = heartbeat_interval
         self.connection_settings = connection_settings
+        self._backend_process: subprocess.Popen | None = None
 
         self._canceled = Event()
         signal.signal(signal.SIGINT, self._sigint_handler)
@@ -149,6 +152,14 @@ class FrontendRunner:
         )
         args.extend(["--bootstrap-log-file", bootstrap_log_path])
 
+        # On POSIX, the backend signals that it has written the connection file through a pipe
+        # inherited from this process, so we can block on it instead of polling for the file.
+        ready_read_fd: int | None = None
+        ready_write_fd: int | None = None
+        if OSName.is_posix():  # pragma: is-windows
+            ready_read_fd, ready_write_fd = os.pipe()
+            args.extend(["--ready-fd", str(ready_write_fd)])
+
         _logger.debug(f"Running process with args: {args}")
         bootstrap_output_path = os.path.join(
             bootstrap_log_dir, f"adaptor-runtime-background-bootstrap-output-{bootstrap_id}.log"
@@ -163,15 +174,30 @@ class FrontendRunner:
                 stdin=subprocess.DEVNULL,
                 stdout=output_log_file,
                 stderr=output_log_file,
+                pass_fds=(ready_write_fd,) if ready_write_fd is not None else (),
             )
         except Exception as e:
             _logger.error(f"Failed to initialize backend process: {e}")
+            if ready_read_fd is not None:  # pragma: is-windows
+                os.close(ready_read_fd)
             raise
+        finally:
+            # Close our copy of the write end so we see EOF if the backend exits without
+            # signaling
+            if ready_write_fd is not None:  # pragma: is-windows
+                os.close(ready_write_fd)
+        self._backend_process = process
         _logger.info(f"Started backend process. PID: {process.pid}")
 
         # Wait for backend process to create connection file
+        connection_settings: ConnectionSettings | None = None
         try:
-            _wait_for_connection_file(str(connection_file_path), max_retries=5, interval_s=1)
+            if ready_read_fd is not None:  # pragma: is-windows
+                _wait_for_ready_signal(ready_read_fd, timeout_s=_BACKEND_READY_TIMEOUT_S)
+            else:  # pragma: is-posix
+                connection_settings = _wait_for_connection_file(
+                    str(connection_file_path), max_retries=5, interval_s=1
+                )
         except TimeoutError:
             _logger.error(
                 "Backend process failed to write connection file in time at: "
@@ -189,6 +215,8 @@ class FrontendRunner:
             # Close file handle to prevent further writes
             # At this point, we have all the logs/output we need from the bootstrap
             output_log_file.close()
+            if ready_read_fd is not None:  # pragma: is-windows
+                os.close(ready_read_fd)
             if process.stdout:
                 process.stdout.close()
             if process.stderr:
@@ -213,8 +241,11 @@ class FrontendRunner:
                     _logger.info(line.strip())
                 _logger.info("========== END BOOTSTRAP LOG CONTENTS ==========")
 
-        # Load up connection settings for the heartbeat requests
-        self.connection_settings = ConnectionSettingsFileLoader(connection_file_path).load()
+        # Load up connection settings for the heartbeat requests, unless they were already loaded
+        # while waiting for the connection file
+        if connection_settings is None:  # pragma: is-windows
+            connection_settings = ConnectionSettingsFileLoader(connection_file_path).load()
+        self.connection_settings = connection_settings
 
         # Heartbeat to ensure backend process is listening for requests
         _logger.info("Verifying connection to backend...")
@@ -288,7 +319,10 @@ class FrontendRunner:
         while True:
             _logger.debug("Sending heartbeat request...")
             heartbeat = self._heartbeat(ack_id)
-            _logger.debug(f"Heartbeat response: {json.dumps(heartbeat, cls=DataclassJSONEncoder)}")
+            if _logger.isEnabledFor(logging.DEBUG):
+                _logger.debug(
+                    f"Heartbeat response: {json.dumps(heartbeat, cls=DataclassJSONEncoder)}"
+                )
             for line in heartbeat.output.output.splitlines():
                 _logger.log(_ADAPTOR_OUTPUT_LEVEL, line)
 
@@ -416,6 +450,27 @@ class FrontendRunner:
         self.cancel()
 
 
+def _wait_for_ready_signal(fd: int, timeout_s: float) -> None:  # pragma: is-windows
+    """
+    Waits for the backend process to write to the ready pipe, which it does once the connection
+    file has been written.
+
+    Args:
+        fd (int): The read end of the ready pipe.
+        timeout_s (float): The max time to wait, in seconds.
+
+    Raises:
+        TimeoutError: Raised when the backend does not signal within timeout_s seconds, or closes
+            the pipe without signaling (e.g. it exited).
+    """
+    _logger.info("Waiting for backend process to signal it is ready")
+    readable, _, _ = select.select([fd], [], [], timeout_s)
+    if not readable:
+        raise TimeoutError("Timed out waiting for backend process to signal it is ready")
+    if not os.read(fd, 1):
+        raise TimeoutError("Backend process closed the ready pipe without signaling it is ready")
+
+
 def _wait_for_connection_file(
     filepath: str, max_retries: int, interval_s: float = 1
 ) -> ConnectionSettings:
@@ -457,9 +512,12 @@ def _wait_for_connection_file(
         max_retries=max_retries,
     )
 
+    connection_settings: ConnectionSettings | None = None
+
     def connection_file_loadable() -> bool:
+        nonlocal connection_settings
         try:
-            ConnectionSettingsFileLoader(Path(filepath)).load()
+            connection_settings = ConnectionSettingsFileLoader(Path(filepath)).load()
         except Exception:
             return False
         else:
@@ -472,7 +530,9 @@ def _wait_for_connection_file(
         max_retries=max_retries,
     )
 
-    return ConnectionSettingsFileLoader(Path(filepath)).load()
+    # wait_for raises if the predicate never succeeded, so the settings have been loaded
+    assert connection_settings is not None
+    return connection_settings
 
 
 def wait_for(
@@ -79,6 +79,10 @@ _CLI_HELP_TEXT = {
         f"connection data from the environment variable: {_OPENJD_ADAPTOR_SOCKET_ENV}"
     ),
     "log_file": "The file to log adaptor output to. Default is to not log to a file.",
+    "ready_fd": (
+        "File descriptor of a pipe inherited from the frontend process. A single byte is written "
+        "to it once the connection file has been written."
+    ),
 }
 
 _DIR = os.path.dirname(os.path.realpath(__file__))
@@ -114,6 +118,7 @@ class _ParsedArgs(Namespace):
     path_mapping_rules: str
     connection_file: str | None
     bootstrap_log_file: str | None
+    ready_fd: int | None
 
     # is-compatible args
     openjd_adaptor_cli_version: str | None
@@ -410,6 +415,7 @@ class EntryPoint:
                 AdaptorRunner(adaptor=adaptor),
                 connection_file_path=connection_file,
                 log_buffer=log_buffer,
+                ready_fd=parsed_args.ready_fd if hasattr(parsed_args, "ready_fd") else None,
             )
             backend.run(
                 on_connection_file_written=cast(
@@ -535,6 +541,14 @@ class EntryPoint:
             required=False,
         )
 
+        ready_fd = ArgumentParser(add_help=False)
+        ready_fd.add_argument(
+            "--ready-fd",
+            type=int,
+            help=_CLI_HELP_TEXT["ready_fd"],
+            required=False,
+        )
+
         bg_parser = subparser.add_parser("daemon", help="Runs the adaptor in a daemon mode.")
         bg_subparser = bg_parser.add_subparsers(
             dest="subcommand",
@@ -547,7 +561,7 @@ class EntryPoint:
         # "Hidden" command that actually runs the adaptor runtime in background mode
         bg_subparser.add_parser(
             "_serve",
-            parents=[init_data, path_mapping_rules, connection_file, log_file],
+            parents=[init_data, path_mapping_rules, connection_file, log_file, ready_fd],
         )
         bg_subparser.add_parser("start", parents=[init_data, path_mapping_rules, connection_file])
         bg_subparser.add_parser("run", parents=[run_data, connection_file])
@@ -2,18 +2,21 @@
 
 from __future__ import annotations
 
+import itertools
 import json
 import os
 import pathlib
-import re
+import select
+import stat
+import subprocess
 import sys
 import time
 from http import HTTPStatus
 from typing import Generator
 from unittest.mock import patch
+from uuid import uuid4
 from pathlib import Path
 
-import psutil
 import pytest
 
 import openjd.adaptor_runtime._entrypoint as runtime_entrypoint
@@ -21,10 +24,7 @@ from openjd.adaptor_runtime._background.frontend_runner import (
     FrontendRunner,
     HTTPError,
 )
-from openjd.adaptor_runtime._background.loaders import (
-    ConnectionSettingsLoadingError,
-    ConnectionSettingsFileLoader,
-)
+from openjd.adaptor_runtime._background.model import ConnectionSettings
 from openjd.adaptor_runtime._osname import OSName
 
 mod_path = (Path(__file__).parent.parent).resolve()
@@ -35,29 +35,47 @@ else:
     os.environ["PYTHONPATH"] = str(mod_path)
 from AdaptorExample import AdaptorExample  # noqa: E402
 
+_IS_WINDOWS = OSName.is_windows()
+_IS_POSIX = OSName.is_posix()
+_IS_LINUX = OSName.is_linux()
+
 
 class TestDaemonMode:
     """
     Tests for background daemon mode.
     """
 
-    @pytest.fixture(autouse=True)
-    def mock_runtime_logger_level(self, tmpdir: pathlib.Path):
-        # Set up a config file for the backend process
+    @pytest.fixture(scope="session")
+    def runtime_config_path(self, tmp_path_factory: pytest.TempPathFactory) -> str:
+        # Set up a config file for the backend process. The content is constant, so it is only
+        # written once per session.
         config = {"log_level": "DEBUG"}
-        config_path = os.path.join(tmpdir, "configuration.json")
-        with open(config_path, mode="w", encoding="utf-8") as f:
+        config_dir = tmp_path_factory.mktemp("cfg", numbered=False)
+        config_path = os.path.join(config_dir, "configuration.json")
+        tmp_config_path = f"{config_path}.tmp"
+        with open(tmp_config_path, mode="w", encoding="utf-8") as f:
             json.dump(config, f)
-
-        # Override the default config path to the one we just created
-        with (patch.dict(os.environ, {runtime_entrypoint._ENV_CONFIG_PATH_PREFIX: config_path}),):
+        os.replace(tmp_config_path, config_path)
+        return config_path
+
+    @pytest.fixture(autouse=True, scope="class")
+    def mock_runtime_logger_level(self, runtime_config_path: str):
+        # Override the default config path to the one we created
+        with (
+            patch.dict(
+                os.environ, {runtime_entrypoint._ENV_CONFIG_PATH_PREFIX: runtime_config_path}
+            ),
+        ):
             yield
 
-    @pytest.fixture
-    def connection_file_path(self, tmp_path: pathlib.Path) -> pathlib.Path:
-        connection_dir = os.path.join(tmp_path.absolute(), "connection_dir")
-        os.mkdir(connection_dir)
-        if OSName.is_windows():
+    @pytest.fixture(autouse=True)
+    def capture_all_logs(self, caplog: pytest.LogCaptureFixture) -> None:
+        caplog.set_level(0)
+
+    @pytest.fixture(scope="session")
+    def connection_dir(self, tmp_path_factory: pytest.TempPathFactory) -> pathlib.Path:
+        connection_dir = tmp_path_factory.mktemp("conn").absolute()
+        if _IS_WINDOWS:
             # In Windows, to prevent false positives in tests, it's crucial to remove the "Delete subfolders and files"
             # permission from the parent folder. This step ensures that files cannot be deleted without explicit delete
             # permissions, addressing an edge case where the same user owns both the parent folder and the file,
@@ -65,64 +83,76 @@ class TestDaemonMode:
             # write, delete current folder, which meets the requirement.
             from openjd.adaptor_runtime._utils._secure_open import set_file_permissions_in_windows
 
-            set_file_permissions_in_windows(connection_dir)
-        return pathlib.Path(connection_dir) / "connection.json"
+            set_file_permissions_in_windows(str(connection_dir))
+        return connection_dir
 
     @pytest.fixture
-    def initialized_setup(
+    def connection_file_path(self, connection_dir: pathlib.Path) -> pathlib.Path:
+        return connection_dir / f"connection_{uuid4().hex}.json"
+
+    @pytest.fixture(scope="class")
+    def shared_connection_file_path(self, connection_dir: pathlib.Path) -> pathlib.Path:
+        return connection_dir / f"connection_{uuid4().hex}.json"
+
+    @pytest.fixture
+    def initialized_setup_fresh(
         self,
         connection_file_path: pathlib.Path,
-        caplog: pytest.LogCaptureFixture,
-    ) -> Generator[tuple[FrontendRunner, psutil.Process], None, None]:
-        caplog.set_level(0)
+    ) -> Generator[tuple[FrontendRunner, _Proc, ConnectionSettings], None, None]:
         frontend = FrontendRunner(timeout_s=5.0)
         frontend.init(
             adaptor_module=sys.modules[AdaptorExample.__module__],
             connection_file_path=connection_file_path,
         )
 
-        match = re.search("Started backend process. PID: ([0-9]+)", caplog.text)
-        assert match is not None
-        pid = int(match.group(1))
-        backend_proc = psutil.Process(pid)
+        assert frontend._backend_process is not None
+        backend_proc = _Proc(frontend._backend_process)
+        # init loads the connection settings from the connection file, so reuse them
+        conn_settings = frontend.connection_settings
+        assert conn_settings is not None
 
-        yield (frontend, backend_proc)
+        yield (frontend, backend_proc, conn_settings)
 
-        try:
-            backend_proc.kill()
-        except psutil.NoSuchProcess:
-            pass  # Already stopped
-
-        # We don't need to call the `remove` for the NamedPipe server.
-        # NamedPipe servers are managed by Named Pipe File System it is not a regular file.
-        # Once all handles are closed, the system automatically cleans up the named pipe.
-        if OSName.is_posix():
-            try:
-                conn_settings = ConnectionSettingsFileLoader(connection_file_path).load()
-            except ConnectionSettingsLoadingError as e:
-                print(
-                    f"Failed to load connection settings, socket file cleanup will be skipped: {e}"
-                )
-            else:
-                try:
-                    os.remove(conn_settings.socket)
-                except FileNotFoundError:
-                    pass  # Already deleted
+        _cleanup_backend(backend_proc, conn_settings)
+
+    @pytest.fixture(scope="class")
+    def initialized_setup_shared(
+        self,
+        shared_connection_file_path: pathlib.Path,
+    ) -> Generator[tuple[FrontendRunner, _Proc, ConnectionSettings], None, None]:
+        """
+        Same as initialized_setup_fresh, but the backend process is started once and shared by
+        every test in the class. Tests can run in any order, so only use this for tests that
+        neither tear the backend down nor stop the adaptor.
+        """
+        frontend = FrontendRunner(timeout_s=5.0)
+        frontend.init(
+            adaptor_module=sys.modules[AdaptorExample.__module__],
+            connection_file_path=shared_connection_file_path,
+        )
+
+        conn_settings = frontend.connection_settings
+        assert conn_settings is not None
+
+        assert frontend._backend_process is not None
+        backend_proc = _Proc(frontend._backend_process)
+
+        yield (frontend, backend_proc, conn_settings)
+
+        _cleanup_backend(backend_proc, conn_settings)
 
     def test_init(
         self,
-        initialized_setup: tuple[FrontendRunner, psutil.Process],
-        connection_file_path: pathlib.Path,
+        initialized_setup_shared: tuple[FrontendRunner, _Proc, ConnectionSettings],
+        shared_connection_file_path: pathlib.Path,
     ) -> None:
         # GIVEN
-        _, backend_proc = initialized_setup
+        _, backend_proc, connection_settings = initialized_setup_shared
 
         # THEN
-        assert os.path.exists(connection_file_path)
-
-        connection_settings = ConnectionSettingsFileLoader(connection_file_path).load()
+        assert os.path.exists(shared_connection_file_path)
 
-        if OSName.is_windows():
+        if _IS_WINDOWS:
             import pywintypes
             import win32file
 
@@ -142,59 +172,53 @@ class TestDaemonMode:
                 assert False, f"Named pipe is not created successfully. Fail to connect to it: {e}"
 
         else:
-            assert any(
-                [
-                    conn.laddr == connection_settings.socket
-                    for conn in backend_proc.connections(kind="unix")
-                ]
-            )
+            socket_stat = os.stat(connection_settings.socket)
+            assert stat.S_ISSOCK(socket_stat.st_mode)
+            # The backend names its socket after its own PID
+            assert os.path.basename(connection_settings.socket) == str(backend_proc.pid)
 
     def test_shutdown(
         self,
-        initialized_setup: tuple[FrontendRunner, psutil.Process],
+        initialized_setup_fresh: tuple[FrontendRunner, _Proc, ConnectionSettings],
         connection_file_path: pathlib.Path,
     ) -> None:
         # GIVEN
-        frontend, backend_proc = initialized_setup
-        conn_settings = ConnectionSettingsFileLoader(connection_file_path).load()
+        frontend, backend_proc, conn_settings = initialized_setup_fresh
 
         # WHEN
         frontend.shutdown()
 
         # THEN
-        assert all(
-            [
-                _wait_for_file_deletion(p, timeout_s=1)
-                for p in [str(connection_file_path), conn_settings.socket]
-            ]
+        assert _wait_for_all_file_deletions(
+            [str(connection_file_path), conn_settings.socket], timeout_s=1
         )
 
-        # "Assert" the process exits after requesting shutdown.
-        # The "assertion" fails if we time out waiting.
-        backend_proc.wait(timeout=1)
+        # Assert the process exits after requesting shutdown.
+        assert backend_proc.wait(timeout_s=1)
 
     def test_start(
         self,
-        initialized_setup: tuple[FrontendRunner, psutil.Process],
+        initialized_setup_shared: tuple[FrontendRunner, _Proc, ConnectionSettings],
         caplog: pytest.LogCaptureFixture,
     ) -> None:
         # GIVEN
-        frontend, _ = initialized_setup
+        frontend, _, _ = initialized_setup_shared
+        baseline = len(caplog.records)
 
         # WHEN
         frontend.start()
 
         # THEN
-        assert "on_start" in caplog.text
+        assert _log_has(caplog, "on_start", start=baseline)
 
-    @pytest.mark.skipif(not OSName.is_windows(), reason="Windows named pipe test")
+    @pytest.mark.skipif(not _IS_WINDOWS, reason="Windows named pipe test")
     def test_incorrect_request_path_in_windows(
         self,
-        initialized_setup: tuple[FrontendRunner, psutil.Process],
+        initialized_setup_shared: tuple[FrontendRunner, _Proc, ConnectionSettings],
         caplog: pytest.LogCaptureFixture,
     ) -> None:
         # GIVEN
-        frontend, _ = initialized_setup
+        frontend, _, _ = initialized_setup_shared
 
         # WHEN
         with pytest.raises(
@@ -203,14 +227,14 @@ class TestDaemonMode:
         ):
             frontend._send_request("GET", "None")
 
-    @pytest.mark.skipif(not OSName.is_windows(), reason="Windows named pipe test")
+    @pytest.mark.skipif(not _IS_WINDOWS, reason="Windows named pipe test")
     def test_incorrect_request_method_in_windows(
         self,
-        initialized_setup: tuple[FrontendRunner, psutil.Process],
+        initialized_setup_shared: tuple[FrontendRunner, _Proc, ConnectionSettings],
         caplog: pytest.LogCaptureFixture,
     ) -> None:
         # GIVEN
-        frontend, _ = initialized_setup
+        frontend, _, _ = initialized_setup_shared
 
         # WHEN
         with pytest.raises(
@@ -230,46 +254,48 @@ class TestDaemonMode:
     def test_run(
         self,
         run_data: list[dict],
-        initialized_setup: tuple[FrontendRunner, psutil.Process],
+        initialized_setup_shared: tuple[FrontendRunner, _Proc, ConnectionSettings],
         caplog: pytest.LogCaptureFixture,
     ) -> None:
         # GIVEN
-        frontend, _ = initialized_setup
+        frontend, _, _ = initialized_setup_shared
+        baseline = len(caplog.records)
 
         for data in run_data:
             # WHEN
             frontend.run(data)
 
             # THEN
-            assert f"on_run: {data}" in caplog.text
+            assert _log_has(caplog, f"on_run: {data}", start=baseline)
 
     def test_stop(
         self,
-        initialized_setup: tuple[FrontendRunner, psutil.Process],
+        initialized_setup_fresh: tuple[FrontendRunner, _Proc, ConnectionSettings],
         caplog: pytest.LogCaptureFixture,
     ) -> None:
         # GIVEN
-        frontend, _ = initialized_setup
+        frontend, _, _ = initialized_setup_fresh
+        baseline = len(caplog.records)
 
         # WHEN
         frontend.stop()
 
         # THEN
-        assert "on_stop" in caplog.text
+        assert _log_has(caplog, "on_stop", start=baseline)
 
     def test_heartbeat_acks(
         self,
-        initialized_setup: tuple[FrontendRunner, psutil.Process],
+        initialized_setup_fresh: tuple[FrontendRunner, _Proc, ConnectionSettings],
     ) -> None:
         # GIVEN
-        frontend, _ = initialized_setup
+        frontend, _, _ = initialized_setup_fresh
         response = frontend._heartbeat()
 
         # WHEN
         new_response = frontend._heartbeat(response.output.id)
         # In Windows, we need to shut down the namedpipe client,
         # or the connection of the NamedPipe server remains open
-        if OSName.is_windows():
+        if _IS_WINDOWS:
             frontend.shutdown()
         # THEN
         assert f"Received ACK for chunk: {response.output.id}" in new_response.output.output
@@ -282,10 +308,11 @@ class TestDaemonMode:
         """
 
         def test_accepts_same_uid_process(
-            self, initialized_setup: tuple[FrontendRunner, psutil.Process]
+            self,
+            initialized_setup_shared: tuple[FrontendRunner, _Proc, ConnectionSettings],
         ) -> None:
             # GIVEN
-            frontend, _ = initialized_setup
+            frontend, _, _ = initialized_setup_shared
 
             # WHEN
             try:
@@ -301,9 +328,187 @@ class TestDaemonMode:
                 pass
 
 
-def _wait_for_file_deletion(path: str, timeout_s: float) -> bool:
+def _log_has(caplog: pytest.LogCaptureFixture, needle: str, start: int = 0) -> bool:
+    """
+    Checks whether any captured log record from index start onwards contains needle. Only the
+    records that are checked get formatted, unlike caplog.text and caplog.messages.
+    """
+    return any(needle in r.getMessage() for r in itertools.islice(caplog.records, start, None))
+
+
+class _Proc:
+    """
+    Minimal handle to the backend process. A pidfd (Linux) or process handle (Windows) is opened
+    up front so that waiting for the process to exit is a single blocking call rather than a
+    polling loop.
+    """
+
+    __slots__ = ("pid", "_popen", "_fd", "_handle")
+
+    def __init__(self, popen: subprocess.Popen) -> None:
+        self.pid = popen.pid
+        self._popen = popen
+        self._fd: int | None = None
+        self._handle = None
+        if _IS_LINUX and hasattr(os, "pidfd_open"):
+            try:
+                self._fd = os.pidfd_open(self.pid)
+            except OSError:
+                pass  # Already exited and reaped, or pidfd_open is not supported by this kernel
+        elif _IS_WINDOWS:
+            import pywintypes
+            import win32api
+            import win32con
+
+            try:
+                self._handle = win32api.OpenProcess(win32con.SYNCHRONIZE, False, self.pid)
+            except pywintypes.error:
+                pass  # Process no longer exists
+
+    def kill(self) -> None:
+        self._popen.kill()
+
+    def wait(self, timeout_s: float) -> bool:
+        """
+        Waits for the process to exit.
+
+        Returns:
+            bool: True if the process exited before the timeout, False otherwise.
+        """
+        if self._fd is not None:
+            readable, _, _ = select.select([self._fd], [], [], timeout_s)
+            return bool(readable)
+        elif self._handle is not None:
+            import win32event
+
+            result = win32event.WaitForSingleObject(self._handle, int(timeout_s * 1000))
+            return result == win32event.WAIT_OBJECT_0
+
+        try:
+            self._popen.wait(timeout=timeout_s)
+        except subprocess.TimeoutExpired:
+            return False
+        return True
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+        elif self._handle is not None:
+            import win32api
+
+            win32api.CloseHandle(self._handle)
+            self._handle = None
+
+
+def _cleanup_backend(backend_proc: _Proc, conn_settings: ConnectionSettings) -> None:
+    try:
+        backend_proc.kill()
+    finally:
+        backend_proc.close()
+
+    # We don't need to call the `remove` for the NamedPipe server.
+    # NamedPipe servers are managed by Named Pipe File System it is not a regular file.
+    # Once all handles are closed, the system automatically cleans up the named pipe.
+    if _IS_POSIX:
+        try:
+            os.remove(conn_settings.socket)
+        except FileNotFoundError:
+            pass  # Already deleted
+
+
+def _wait_for_all_file_deletions(paths: list[str], timeout_s: float) -> bool:
+    """
+    Waits for all of the files at the specified paths to be deleted. Uses a single filesystem
+    change notification wait over all of their parent directories (inotify on Linux, change
+    notification handles on Windows) rather than polling each path. Falls back to polling on
+    other platforms or if a directory cannot be watched.
+
+    Returns:
+        bool: True if all of the files were deleted before the timeout, False otherwise.
+    """
+    if _IS_LINUX:
+        return _wait_for_all_file_deletions_inotify(paths, timeout_s)
+    elif _IS_WINDOWS:
+        return _wait_for_all_file_deletions_win(paths, timeout_s)
+    else:
+        return _wait_for_file_deletions(paths, timeout_s)
+
+
+def _wait_for_all_file_deletions_inotify(paths: list[str], timeout_s: float) -> bool:
+    from inotify_simple import INotify, flags
+
+    with INotify() as inotify:
+        watched_dirs: dict[int, str] = {}
+        for dir_path in {os.path.dirname(p) for p in paths}:
+            try:
+                wd = inotify.add_watch(dir_path, flags.DELETE | flags.MOVED_FROM)
+            except OSError:
+                return _wait_for_file_deletions(paths, timeout_s)
+            watched_dirs[wd] = dir_path
+
+        # The watches are registered before this check so a deletion in between cannot be missed
+        remaining = {(os.path.dirname(p), os.path.basename(p)) for p in paths if os.path.exists(p)}
+
+        deadline = time.monotonic() + timeout_s
+        while remaining and (time_left := deadline - time.monotonic()) > 0:
+            readable, _, _ = select.select([inotify.fd], [], [], time_left)
+            if not readable:
+                break
+            for event in inotify.read(timeout=0):
+                if (event_dir := watched_dirs.get(event.wd)) is not None:
+                    remaining.discard((event_dir, event.name))
+                else:
+                    # IN_Q_OVERFLOW has wd == -1 and means events were dropped, so fall back to
+                    # checking which files still exist
+                    remaining = {p for p in remaining if os.path.exists(os.path.join(*p))}
+    return not any(os.path.exists(os.path.join(*p)) for p in remaining)
+
+
+def _wait_for_all_file_deletions_win(paths: list[str], timeout_s: float) -> bool:
+    import pywintypes
+    import win32con
+    import win32event
+    import win32file
+
+    handles: dict[str, int] = {}
+    unwatched_paths: set[str] = set()
+    for path in paths:
+        dir_path = os.path.dirname(path)
+        if dir_path in handles:
+            continue
+        try:
+            handles[dir_path] = win32file.FindFirstChangeNotification(
+                dir_path, False, win32con.FILE_NOTIFY_CHANGE_FILE_NAME
+            )
+        except pywintypes.error:
+            # e.g. named pipes, which do not live in a watchable directory
+            unwatched_paths.add(path)
+    handle_list = list(handles.values())
+
+    try:
+        deadline = time.monotonic() + timeout_s
+        while pending := [p for p in paths if os.path.exists(p)]:
+            time_left = deadline - time.monotonic()
+            if time_left <= 0:
+                return False
+            # Paths we could not watch still have to be polled
+            wait_s = min(time_left, 0.01) if unwatched_paths.intersection(pending) else time_left
+            if not handle_list:
+                time.sleep(wait_s)
+                continue
+            result = win32event.WaitForMultipleObjects(handle_list, False, int(wait_s * 1000))
+            if win32event.WAIT_OBJECT_0 <= result < win32event.WAIT_OBJECT_0 + len(handle_list):
+                win32file.FindNextChangeNotification(handle_list[result - win32event.WAIT_OBJECT_0])
+        return True
+    finally:
+        for handle in handle_list:
+            win32file.FindCloseChangeNotification(handle)
+
+
+def _wait_for_file_deletions(paths: list[str], timeout_s: float) -> bool:
     start = time.time()
-    while os.path.exists(path):
+    while any(os.path.exists(p) for p in paths):
         if time.time() - start < timeout_s:
             time.sleep(0.01)
         else:
@@ -1,20 +1,22 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 from __future__ import annotations
 
+import io
 import json
 import os
 import pathlib
 import signal
 from typing import Generator
-from unittest.mock import MagicMock, Mock, call, mock_open, patch
+from unittest.mock import DEFAULT, MagicMock, Mock, call, patch
 
 import pytest
 
 import openjd.adaptor_runtime._background.backend_runner as backend_runner
 from openjd.adaptor_runtime._background.backend_runner import BackendRunner
-from openjd.adaptor_runtime._background.model import ConnectionSettings, DataclassJSONEncoder
 from openjd.adaptor_runtime._osname import OSName
 
+_IS_POSIX = OSName.is_posix()
+
 
 class TestBackendRunner:
     """
@@ -22,8 +24,8 @@ class TestBackendRunner:
     """
 
     @pytest.fixture(autouse=True)
-    def socket_path(self, tmp_path: pathlib.Path) -> Generator[str, None, None]:
-        if OSName.is_posix():
+    def socket_path(self, tmp_path: pathlib.Path, worker_id: str) -> Generator[str, None, None]:
+        if _IS_POSIX:
             with patch.object(backend_runner.SocketPaths, "get_process_socket_path") as mock:
                 path = os.path.join(tmp_path, "socket", "1234")
                 mock.return_value = path
@@ -36,14 +38,15 @@ class TestBackendRunner:
                     pass
         else:
             with patch.object(backend_runner.NamedPipeHelper, "generate_pipe_name") as mock:
-                path = "\\\\.\\pipe\\AdaptorNamedPipe_1234"
+                # tmp_path is already unique per xdist worker, but pipe names are global
+                path = f"\\\\.\\pipe\\AdaptorNamedPipe_1234-{worker_id}"
                 mock.return_value = path
 
                 yield path
 
     @pytest.fixture(autouse=True)
     def mock_server_cls(self) -> Generator[MagicMock, None, None]:
-        if OSName.is_posix():
+        if _IS_POSIX:
             with patch.object(backend_runner, "BackgroundHTTPServer", autospec=True) as mock:
                 yield mock
         else:
@@ -52,35 +55,39 @@ class TestBackendRunner:
             ) as mock:
                 yield mock
 
-    @patch.object(backend_runner.json, "dump")
+    @pytest.fixture(scope="class")
+    def patched_secure_open(self) -> Generator[MagicMock, None, None]:
+        with patch.object(backend_runner, "secure_open") as mock:
+            yield mock
+
+    @pytest.fixture(autouse=True)
+    def mock_secure_open(self, patched_secure_open: MagicMock) -> MagicMock:
+        # The patch is shared by the class, so drop state left over from previous tests
+        patched_secure_open.reset_mock(return_value=True, side_effect=True)
+        return patched_secure_open
+
+    @patch.multiple(backend_runner, Event=DEFAULT, Thread=DEFAULT)
     @patch.object(backend_runner.os, "remove")
-    @patch.object(backend_runner, "Event")
-    @patch.object(backend_runner, "Thread")
     def test_run(
         self,
-        mock_thread: MagicMock,
-        mock_event: MagicMock,
         mock_os_remove: MagicMock,
-        mock_json_dump: MagicMock,
+        mock_secure_open: MagicMock,
         mock_server_cls: MagicMock,
         socket_path: str,
         caplog: pytest.LogCaptureFixture,
+        **mocks: MagicMock,
     ):
         # GIVEN
+        mock_event, mock_thread = mocks["Event"], mocks["Thread"]
         caplog.set_level("DEBUG")
         conn_file = pathlib.Path(os.sep) / "path" / "to" / "conn_file"
-        connection_settings = {"socket": socket_path}
         adaptor_runner = Mock()
         runner = BackendRunner(adaptor_runner, connection_file_path=conn_file)
+        conn_file_contents = io.StringIO()
+        mock_secure_open.return_value.__enter__.return_value = conn_file_contents
 
         # WHEN
-        open_mock: MagicMock
-        with patch.object(
-            backend_runner,
-            "secure_open",
-            mock_open(read_data=json.dumps(connection_settings)),
-        ) as open_mock:
-            runner.run()
+        runner.run()
 
         # THEN
         assert caplog.messages == [
@@ -96,18 +103,34 @@ class TestBackendRunner:
         )
         mock_thread.assert_called_once()
         mock_thread.return_value.start.assert_called_once()
-        open_mock.assert_called_once_with(conn_file, open_mode="w", encoding="utf-8")
-        mock_json_dump.assert_called_once_with(
-            ConnectionSettings(socket_path),
-            open_mock.return_value,
-            cls=DataclassJSONEncoder,
-        )
+        mock_secure_open.assert_called_once_with(conn_file, open_mode="w", encoding="utf-8")
+        assert json.loads(conn_file_contents.getvalue()) == {"socket": socket_path}
         mock_thread.return_value.join.assert_called_once()
-        if OSName.is_posix():
+        if _IS_POSIX:
             mock_os_remove.assert_has_calls([call(conn_file), call(socket_path)])
         else:
             mock_os_remove.assert_has_calls([call(conn_file)])
 
+    @pytest.mark.skipif(not _IS_POSIX, reason="The ready pipe is only used on POSIX")
+    @patch.multiple(backend_runner, Event=DEFAULT, Thread=DEFAULT)
+    @patch.object(backend_runner.os, "remove")
+    def test_run_signals_ready_fd(self, mock_os_remove: MagicMock, **mocks: MagicMock):
+        # GIVEN
+        read_fd, write_fd = os.pipe()
+        conn_file = pathlib.Path(os.sep) / "path" / "to" / "conn_file"
+        runner = BackendRunner(Mock(), connection_file_path=conn_file, ready_fd=write_fd)
+
+        try:
+            # WHEN
+            runner.run()
+
+            # THEN
+            assert os.read(read_fd, 1) == b"\x01"
+            # The write end was closed, so there is nothing more to read
+            assert os.read(read_fd, 1) == b""
+        finally:
+            os.close(read_fd)
+
     def test_run_raises_when_http_server_fails_to_start(
         self,
         mock_server_cls: MagicMock,
@@ -133,23 +156,21 @@ class TestBackendRunner:
             "Error starting in background mode: ",
         ]
 
-    @patch.object(backend_runner, "secure_open")
+    @patch.multiple(backend_runner, Event=DEFAULT, Thread=DEFAULT)
     @patch.object(backend_runner.os, "remove")
-    @patch.object(backend_runner, "Event")
-    @patch.object(backend_runner, "Thread")
     def test_run_raises_when_writing_connection_file_fails(
         self,
-        mock_thread: MagicMock,
-        mock_event: MagicMock,
         mock_os_remove: MagicMock,
-        open_mock: MagicMock,
+        mock_secure_open: MagicMock,
         socket_path: str,
         caplog: pytest.LogCaptureFixture,
+        **mocks: MagicMock,
     ):
         # GIVEN
+        mock_event, mock_thread = mocks["Event"], mocks["Thread"]
         caplog.set_level("DEBUG")
         err = OSError()
-        open_mock.side_effect = err
+        mock_secure_open.side_effect = err
         conn_file = pathlib.Path(os.sep) / "path" / "to" / "conn_file"
         adaptor_runner = Mock()
         runner = BackendRunner(adaptor_runner, connection_file_path=conn_file)
@@ -170,9 +191,9 @@ class TestBackendRunner:
         ]
         mock_thread.assert_called_once()
         mock_thread.return_value.start.assert_called_once()
-        open_mock.assert_called_once_with(conn_file, open_mode="w", encoding="utf-8")
+        mock_secure_open.assert_called_once_with(conn_file, open_mode="w", encoding="utf-8")
         mock_thread.return_value.join.assert_called_once()
-        if OSName.is_posix():
+        if _IS_POSIX:
             mock_os_remove.assert_has_calls([call(conn_file), call(socket_path)])
         else:
             mock_os_remove.assert_has_calls([call(conn_file)])
@@ -197,7 +218,7 @@ class TestBackendRunner:
 
         # THEN
         signal_mock.assert_any_call(signal.SIGINT, runner._sigint_handler)
-        if OSName.is_posix():
+        if _IS_POSIX:
             signal_mock.assert_any_call(signal.SIGTERM, runner._sigint_handler)
         else:
             signal_mock.assert_any_call(signal.SIGBREAK, runner._sigint_handler)  # type: ignore[attr-defined]
@@ -13,7 +13,7 @@ import tempfile
 from pathlib import Path
 from types import ModuleType
 from typing import Generator, Optional
-from unittest.mock import MagicMock, call, patch
+from unittest.mock import ANY, MagicMock, call, patch
 
 import pytest
 
@@ -25,6 +25,7 @@ from openjd.adaptor_runtime._background.frontend_runner import (
     FrontendRunner,
     HTTPError,
     _wait_for_connection_file,
+    _wait_for_ready_signal,
 )
 from openjd.adaptor_runtime._background.model import (
     AdaptorStatus,
@@ -94,6 +95,11 @@ class TestFrontendRunner:
             with patch.object(frontend_runner, "_wait_for_connection_file") as m:
                 yield m
 
+        @pytest.fixture(autouse=True)
+        def mock_wait_for_ready_signal(self) -> Generator[MagicMock, None, None]:
+            with patch.object(frontend_runner, "_wait_for_ready_signal") as m:
+                yield m
+
         @pytest.fixture(autouse=True)
         def mock_heartbeat(self) -> Generator[MagicMock, None, None]:
             with patch.object(frontend_runner.FrontendRunner, "_heartbeat") as m:
@@ -126,6 +132,8 @@ class TestFrontendRunner:
             mock_path_exists: MagicMock,
             mock_Popen: MagicMock,
             mock_wait_for_connection_file: MagicMock,
+            mock_wait_for_ready_signal: MagicMock,
+            mock_connection_settings_file_load: MagicMock,
             mock_heartbeat: MagicMock,
             mock_sys_executable: MagicMock,
             mock_sys_argv: MagicMock,
@@ -203,6 +211,12 @@ class TestFrontendRunner:
                     ),
                 ]
             )
+            expected_pass_fds: tuple[int, ...] = ()
+            if OSName.is_posix():
+                popen_args = mock_Popen.call_args.args[0]
+                ready_fd = int(popen_args[popen_args.index("--ready-fd") + 1])
+                expected_args.extend(["--ready-fd", str(ready_fd)])
+                expected_pass_fds = (ready_fd,)
             mock_Popen.assert_called_once_with(
                 expected_args,
                 shell=False,
@@ -211,12 +225,27 @@ class TestFrontendRunner:
                 stdin=subprocess.DEVNULL,
                 stdout=open_mock.return_value,
                 stderr=open_mock.return_value,
+                pass_fds=expected_pass_fds,
             )
-            mock_wait_for_connection_file.assert_called_once_with(
-                str(connection_file_path),
-                max_retries=5,
-                interval_s=1,
-            )
+            if OSName.is_posix():
+                mock_wait_for_ready_signal.assert_called_once_with(
+                    ANY,
+                    timeout_s=frontend_runner._BACKEND_READY_TIMEOUT_S,
+                )
+                mock_wait_for_connection_file.assert_not_called()
+                mock_connection_settings_file_load.assert_called_once()
+                assert runner.connection_settings is mock_connection_settings_file_load.return_value
+            else:
+                mock_wait_for_connection_file.assert_called_once_with(
+                    str(connection_file_path),
+                    max_retries=5,
+                    interval_s=1,
+                )
+                mock_wait_for_ready_signal.assert_not_called()
+                # The settings loaded while waiting for the connection file are reused
+                mock_connection_settings_file_load.assert_not_called()
+                assert runner.connection_settings is mock_wait_for_connection_file.return_value
+            assert runner._backend_process is mock_Popen.return_value
             mock_heartbeat.assert_called_once()
 
         def test_raises_when_adaptor_module_not_package(self):
@@ -301,12 +330,14 @@ class TestFrontendRunner:
             mock_path_exists: MagicMock,
             mock_Popen: MagicMock,
             mock_wait_for_connection_file: MagicMock,
+            mock_wait_for_ready_signal: MagicMock,
             caplog: pytest.LogCaptureFixture,
         ):
             # GIVEN
             caplog.set_level("DEBUG")
             err = TimeoutError()
             mock_wait_for_connection_file.side_effect = err
+            mock_wait_for_ready_signal.side_effect = err
             mock_path_exists.return_value = False
             pid = 123
             mock_Popen.return_value.pid = pid
@@ -334,11 +365,14 @@ class TestFrontendRunner:
             )
             mock_path_exists.assert_called_once_with()
             mock_Popen.assert_called_once()
-            mock_wait_for_connection_file.assert_called_once_with(
-                str(conn_file_path),
-                max_retries=5,
-                interval_s=1,
-            )
+            if OSName.is_posix():
+                mock_wait_for_ready_signal.assert_called_once()
+            else:
+                mock_wait_for_connection_file.assert_called_once_with(
+                    str(conn_file_path),
+                    max_retries=5,
+                    interval_s=1,
+                )
 
     class TestHeartbeat:
         """
@@ -958,9 +992,11 @@ class TestWaitForConnectionFile:
         mock_conn_file_loader_load.return_value = ConnectionSettings("/server")
 
         # WHEN
-        _wait_for_connection_file(filepath, max_retries, interval)
+        result = _wait_for_connection_file(filepath, max_retries, interval)
 
         # THEN
+        assert result is mock_conn_file_loader_load.return_value
+        mock_conn_file_loader_load.assert_called_once()
         mock_exists.assert_has_calls([call(filepath)] * 2)
         mock_sleep.assert_has_calls([call(interval)] * 3)
         open_mock.assert_has_calls([call(filepath, mode="r", encoding="utf-8")] * 2)
@@ -986,3 +1022,56 @@ class TestWaitForConnectionFile:
         assert raised_err.match(f"Timed out waiting for File '{filepath}' to exist")
         mock_exists.assert_called_once_with(filepath)
         mock_sleep.assert_not_called()
+
+
+@pytest.mark.skipif(not OSName.is_posix(), reason="The ready pipe is only used on POSIX")
+class TestWaitForReadySignal:
+    """
+    Tests for the _wait_for_ready_signal method
+    """
+
+    @pytest.fixture
+    def ready_pipe(self) -> Generator[tuple[int, int], None, None]:
+        read_fd, write_fd = os.pipe()
+        yield read_fd, write_fd
+        for fd in (read_fd, write_fd):
+            try:
+                os.close(fd)
+            except OSError:
+                pass  # Already closed by the test
+
+    def test_returns_when_signaled(self, ready_pipe: tuple[int, int]):
+        # GIVEN
+        read_fd, write_fd = ready_pipe
+        os.write(write_fd, b"\x01")
+
+        # WHEN
+        _wait_for_ready_signal(read_fd, timeout_s=1)
+
+        # THEN
+        # No exception was raised
+
+    def test_raises_when_timed_out(self, ready_pipe: tuple[int, int]):
+        # GIVEN
+        read_fd, _ = ready_pipe
+
+        # WHEN
+        with pytest.raises(TimeoutError) as raised_err:
+            _wait_for_ready_signal(read_fd, timeout_s=0.01)
+
+        # THEN
+        assert raised_err.match("Timed out waiting for backend process to signal it is ready")
+
+    def test_raises_when_pipe_closed_without_signal(self, ready_pipe: tuple[int, int]):
+        # GIVEN
+        read_fd, write_fd = ready_pipe
+        os.close(write_fd)
+
+        # WHEN
+        with pytest.raises(TimeoutError) as raised_err:
+            _wait_for_ready_signal(read_fd, timeout_s=1)
+
+        # THEN
+        assert raised_err.match(
+            "Backend process closed the ready pipe without signaling it is ready"
+        )
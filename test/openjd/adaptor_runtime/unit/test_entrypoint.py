@@ -499,6 +499,48 @@ class TestStart:
             mock_adaptor_runner.return_value,
             connection_file_path=conn_file.resolve(),
             log_buffer=mock_log_buffer.return_value,
+            ready_fd=None,
+        )
+        mock_run.assert_called_once()
+
+    @patch.object(runtime_entrypoint, "InMemoryLogBuffer")
+    @patch.object(runtime_entrypoint, "AdaptorRunner")
+    @patch.object(BackendRunner, "run")
+    @patch.object(BackendRunner, "__init__", return_value=None)
+    def test_runs_background_serve_with_ready_fd(
+        self,
+        mock_init: MagicMock,
+        mock_run: MagicMock,
+        mock_adaptor_runner: MagicMock,
+        mock_log_buffer: MagicMock,
+        mock_adaptor_cls: MagicMock,
+    ):
+        # GIVEN
+        conn_file = Path(os.sep) / "path" / "to" / "conn_file"
+        with patch.object(
+            runtime_entrypoint.sys,
+            "argv",
+            [
+                "Adaptor",
+                "daemon",
+                "_serve",
+                "--connection-file",
+                str(conn_file),
+                "--ready-fd",
+                "7",
+            ],
+        ):
+            entrypoint = EntryPoint(mock_adaptor_cls)
+
+            # WHEN
+            entrypoint.start()
+
+        # THEN
+        mock_init.assert_called_once_with(
+            mock_adaptor_runner.return_value,
+            connection_file_path=conn_file.resolve(),
+            log_buffer=mock_log_buffer.return_value,
+            ready_fd=7,
         )
         mock_run.assert_called_once()
 